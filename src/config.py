@@ -4,6 +4,8 @@ from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+from shared.input_utils import loads_json
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable loading and validation."""
@@ -51,8 +53,8 @@ def load_json_setting(filename: str, settings_dir: str = "settings") -> Dict[str
         raise FileNotFoundError(f"Configuration file not found: {filepath}")
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        with open(filepath, "rb") as f:
+            config = loads_json(f.read())
 
         if not config:
             raise ValueError(f"Configuration file is empty: {filepath}")
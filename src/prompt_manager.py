@@ -1,27 +1,35 @@
 import os
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Loaded prompts shared by all PromptManager instances, keyed by absolute file
+# path and stored with the file's (mtime, size) so edits on disk are picked up
+_prompt_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
 
 class PromptManager:
     """
     Simple prompt manager for reading prompt files.
     """
 
-    def __init__(self, prompts_dir: str = "prompts"):
+    def __init__(self, prompts_dir: str = "prompts", preload: bool = False):
         """
         Initialize the prompt manager.
 
         Args:
             prompts_dir: Directory containing prompt files
+            preload: Read every prompt file into the cache up front
         """
         self.prompts_dir = prompts_dir
+        self._abs_prompts_dir = os.path.abspath(prompts_dir)
 
         # Ensure prompts directory exists
         if not os.path.exists(self.prompts_dir):
             logger.warning(f"Prompts directory '{self.prompts_dir}' does not exist")
+        elif preload:
+            self.preload_prompts()
 
     def get_prompt(self, name: str) -> str:
         """
@@ -38,26 +46,67 @@ class PromptManager:
             IOError: If there's an error reading the file
         """
         # Ensure .md extension
-        if not name.endswith(".md"):
-            name += ".md"
+        name = name.removesuffix(".md") + ".md"
 
         filepath = os.path.join(self.prompts_dir, name)
-
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Prompt file not found: {filepath}")
+        cache_key = os.path.join(self._abs_prompts_dir, name)
 
         try:
-            # Read file content
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-
-            logger.debug(f"Loaded prompt: {name}")
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                # Serve from cache while the file is unchanged. The size is
+                # compared too, since mtime alone can be coarse.
+                file_stat = os.fstat(fd)
+                version = (file_stat.st_mtime_ns, file_stat.st_size)
+                cached = _prompt_cache.get(cache_key)
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+
+                # Read until EOF, os.read may return fewer bytes than asked for
+                chunks = []
+                while True:
+                    chunk = os.read(fd, max(file_stat.st_size, 4096))
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                content = b"".join(chunks).decode("utf-8")
+
+                # Only cache content that was not modified while being read
+                end_stat = os.fstat(fd)
+                cacheable = version == (end_stat.st_mtime_ns, end_stat.st_size)
+            finally:
+                os.close(fd)
+
+            # Match text-mode newline handling for files saved with CRLF
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            content = content.strip()
+
+            if cacheable:
+                _prompt_cache[cache_key] = (version, content)
+            logger.debug("Loaded prompt: %s", name)
             return content
 
+        except FileNotFoundError:
+            # Let the open itself decide existence instead of a separate check
+            raise FileNotFoundError(f"Prompt file not found: {filepath}")
         except Exception as e:
-            logger.error(f"Error loading prompt '{name}': {str(e)}")
+            logger.error("Error loading prompt '%s': %s", name, e)
             raise IOError(f"Error reading prompt file {filepath}: {str(e)}")
 
+    def preload_prompts(self) -> None:
+        """Load all prompt files in the prompts directory into the cache."""
+        for prompt_name in self.list_available_prompts():
+            try:
+                self.get_prompt(prompt_name)
+            except OSError as e:
+                logger.warning("Could not preload prompt '%s': %s", prompt_name, e)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached prompt contents shared between instances."""
+        _prompt_cache.clear()
+
     def list_available_prompts(self) -> list[str]:
         """
         List all available prompt files in the prompts directory.
@@ -65,17 +114,16 @@ class PromptManager:
         Returns:
             List of prompt file names (without .md extension)
         """
-        if not os.path.exists(self.prompts_dir):
+        if not os.path.isdir(self.prompts_dir):
             return []
 
         try:
-            files = [
-                f[:-3]
-                for f in os.listdir(self.prompts_dir)
-                if f.endswith(".md")
-                and os.path.isfile(os.path.join(self.prompts_dir, f))
-            ]
-            return sorted(files)
+            with os.scandir(self.prompts_dir) as entries:
+                return sorted(
+                    entry.name[:-3]
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                )
         except Exception as e:
             logger.error(f"Error listing prompt files: {str(e)}")
             return []
@@ -89,5 +137,11 @@ def get_prompt_manager(prompts_dir: str = "prompts") -> PromptManager:
     """Get global prompt manager instance, creating it if needed."""
     global _prompt_manager
     if _prompt_manager is None:
-        _prompt_manager = PromptManager(prompts_dir)
+        _prompt_manager = PromptManager(prompts_dir, preload=True)
     return _prompt_manager
+
+
+def reset_prompt_manager() -> None:
+    """Discard the global prompt manager so the next call creates a new one."""
+    global _prompt_manager
+    _prompt_manager = None
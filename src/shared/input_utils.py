@@ -2,9 +2,32 @@ import json
 import logging
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def loads_json(data: Any) -> Any:
+    """
+    Decode JSON from a str or bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def parse_json_input(input_value: Any, expected_key: str) -> str:
     """
     Parse JSON input that may be passed by LangChain and extract the expected value.
@@ -19,11 +42,13 @@ def parse_json_input(input_value: Any, expected_key: str) -> str:
     if not isinstance(input_value, str):
         return str(input_value) if input_value is not None else ""
     
-    # Check if it looks like JSON
-    if input_value.startswith('{"') or input_value.startswith("{'"):
+    input_value = input_value.strip()
+
+    # Check if it looks like JSON (a single character test, the parser decides the rest)
+    if input_value[:1] == "{":
         try:
             # Try to parse as JSON and extract the expected key
-            data = json.loads(input_value.replace("'", '"'))
+            data = loads_json(input_value.replace("'", '"'))
             if isinstance(data, dict) and expected_key in data:
                 extracted_value = data[expected_key]
                 logger.debug(f"Extracted {expected_key} from JSON: {extracted_value}")
@@ -32,7 +57,7 @@ def parse_json_input(input_value: Any, expected_key: str) -> str:
             # If JSON parsing fails, return the original string
             pass
     
-    return input_value.strip() if input_value else ""
+    return input_value
 
 
 def parse_location_input(location: str) -> str:
@@ -78,11 +103,13 @@ def parse_dual_date_input(input_str: str) -> Dict[str, str]:
     if not isinstance(input_str, str):
         return {"start_date": "", "end_date": ""}
     
+    input_str = input_str.strip()
+
     # Check if it looks like JSON
-    if input_str.startswith('{"') or input_str.startswith("{'"):
+    if input_str[:1] == "{":
         try:
             # Try to parse as JSON and extract both dates
-            data = json.loads(input_str.replace("'", '"'))
+            data = loads_json(input_str.replace("'", '"'))
             if isinstance(data, dict):
                 start_date = data.get("start_date", "")
                 end_date = data.get("end_date", "")
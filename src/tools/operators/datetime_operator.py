@@ -1,7 +1,11 @@
+import re
+import time
+import functools
 import requests
 import logging
 from typing import Optional, Dict, Any, Union
-from datetime import datetime
+from datetime import datetime, date as date_type, timezone
+from email.utils import parsedate_to_datetime
 
 from langchain.tools import tool
 
@@ -10,6 +14,18 @@ logger = logging.getLogger(__name__)
 # digidatesAPI base URL
 DIGIDATES_API_URL = "https://digidates.de/api/v1"
 
+# Timestamp formats that can be converted locally without calling the API.
+# Timestamps without an explicit zone are interpreted as UTC.
+LOCAL_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+)
+
+# Year field of an RFC 2822 date such as "Sat, 01 Jan 2022 00:00:00"
+RFC2822_YEAR_PATTERN = re.compile(r"\b\d{1,2}\s+[A-Za-z]{3}\s+(\d+)\b")
+
 
 def make_digidates_request(
     endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -48,11 +64,75 @@ def make_digidates_request(
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_iso_date(value: str) -> date_type:
+    """
+    Parse a "YYYY-MM-DD" date string, caching results for repeated dates.
+
+    Args:
+        value: Date string in ISO format
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If the string is not a valid ISO date
+    """
+    return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+
+
+def parse_timestamp_locally(timestamp: str) -> Optional[datetime]:
+    """
+    Parse common timestamp formats without calling the digidatesAPI.
+
+    Timestamps without an explicit zone are interpreted as UTC, so the result
+    does not depend on the timezone of the host running the service.
+
+    Args:
+        timestamp: Timestamp string (ISO-like or RFC 2822)
+
+    Returns:
+        Parsed datetime converted to UTC, or None if the format is not recognized
+    """
+    value = timestamp.strip()
+
+    dt = None
+    for fmt in LOCAL_TIMESTAMP_FORMATS:
+        try:
+            dt = datetime.strptime(value, fmt)
+            break
+        except ValueError:
+            continue
+
+    if dt is None:
+        # The RFC 2822 parser maps years below 100 to 19xx/20xx. That is right
+        # for two-digit years but not for years like "0050", so leave those to the API.
+        year_match = RFC2822_YEAR_PATTERN.search(value)
+        if year_match and len(year_match.group(1)) > 2 and int(year_match.group(1)) < 100:
+            return None
+
+        # RFC 2822 timestamps like "Sat, 01 Jan 2022 00:00:00"
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    try:
+        return dt.astimezone(timezone.utc)
+    except OverflowError:
+        # Offsets that push the date outside datetime's range are left to the API
+        return None
+
+
 @tool
 def get_unix_time(timestamp: Optional[str] = None) -> str:
     """
     Get Unix timestamp for current time or convert a given timestamp to Unix time.
 
+    Timestamps without a timezone are treated as UTC, and returned dates are UTC dates.
+
     Args:
         timestamp: Optional timestamp to convert (e.g., "1970-01-01 00:00:01", "Sat, 01 Jan 2022 00:00:00")
 
@@ -95,9 +175,20 @@ def get_unix_time(timestamp: Optional[str] = None) -> str:
             elif timestamp.strip() == "":  # Empty or whitespace
                 actual_timestamp = None
 
-        params = {}
-        if actual_timestamp:
-            params["timestamp"] = actual_timestamp
+        # The local clock already knows the current time, no API call needed
+        if not actual_timestamp:
+            now = int(time.time())
+            date_str = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%d")
+            return f"Current Unix timestamp: {now} (Current date: {date_str})"
+
+        # Common formats are converted locally, only exotic ones need the API
+        local_dt = parse_timestamp_locally(str(actual_timestamp))
+        if local_dt is not None:
+            unix_time = int(local_dt.timestamp())
+            date_str = local_dt.strftime("%Y-%m-%d")
+            return f"Unix timestamp for '{actual_timestamp}': {unix_time} (Date: {date_str})"
+
+        params = {"timestamp": actual_timestamp}
 
         result = make_digidates_request("/unixtime", params)
 
@@ -114,26 +205,13 @@ def get_unix_time(timestamp: Optional[str] = None) -> str:
         else:
             unix_time = result
 
-        if actual_timestamp:
-            # Also return the date format for easier processing
-            try:
-                from datetime import datetime
-
-                dt = datetime.fromtimestamp(int(unix_time))
-                date_str = dt.strftime("%Y-%m-%d")
-                return f"Unix timestamp for '{actual_timestamp}': {unix_time} (Date: {date_str})"
-            except:
-                return f"Unix timestamp for '{actual_timestamp}': {unix_time}"
-        else:
-            # Return current time with both unix and readable format
-            try:
-                from datetime import datetime
-
-                dt = datetime.fromtimestamp(int(unix_time))
-                date_str = dt.strftime("%Y-%m-%d")
-                return f"Current Unix timestamp: {unix_time} (Current date: {date_str})"
-            except:
-                return f"Current Unix timestamp: {unix_time}"
+        # Also return the date format for easier processing
+        try:
+            dt = datetime.fromtimestamp(int(unix_time), tz=timezone.utc)
+            date_str = dt.strftime("%Y-%m-%d")
+            return f"Unix timestamp for '{actual_timestamp}': {unix_time} (Date: {date_str})"
+        except:
+            return f"Unix timestamp for '{actual_timestamp}': {unix_time}"
 
     except Exception as e:
         logger.error(f"Error getting Unix time: {str(e)}")
@@ -161,6 +239,13 @@ def get_week_number(date: str) -> str:
         from shared.input_utils import parse_date_input
         actual_date = parse_date_input(date)
 
+        # ISO dates are resolved locally, other formats go to the API
+        try:
+            week_num = parse_iso_date(actual_date).isocalendar()[1]
+            return f"Week number for {actual_date}: {week_num}"
+        except ValueError:
+            pass
+
         params = {"date": actual_date}
         result = make_digidates_request("/week", params)
 
@@ -244,6 +329,13 @@ def validate_date(date: str) -> str:
         from shared.input_utils import parse_date_input
         actual_date = parse_date_input(date)
 
+        # A successful local parse proves validity, the API decides the rest
+        try:
+            parse_iso_date(actual_date)
+            return f"Date {actual_date} is valid"
+        except ValueError:
+            pass
+
         params = {"date": actual_date}
         result = make_digidates_request("/checkdate", params)
 
@@ -283,6 +375,24 @@ def get_weekday(date: str) -> str:
         from shared.input_utils import parse_date_input
         actual_date = parse_date_input(date)
 
+        # Convert number to weekday name
+        weekdays = [
+            "Sunday",
+            "Monday",
+            "Tuesday",
+            "Wednesday",
+            "Thursday",
+            "Friday",
+            "Saturday",
+        ]
+
+        # ISO dates are resolved locally (0=Sunday like the API)
+        try:
+            weekday_num = parse_iso_date(actual_date).isoweekday() % 7
+            return f"Date {actual_date} falls on a {weekdays[weekday_num]} (weekday number: {weekday_num})"
+        except ValueError:
+            pass
+
         params = {"date": actual_date}
         result = make_digidates_request("/weekday", params)
 
@@ -294,16 +404,6 @@ def get_weekday(date: str) -> str:
         else:
             weekday_num = result
 
-        # Convert number to weekday name
-        weekdays = [
-            "Sunday",
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-        ]
         if isinstance(weekday_num, int) and 0 <= weekday_num <= 6:
             weekday_name = weekdays[weekday_num]
             return f"Date {actual_date} falls on a {weekday_name} (weekday number: {weekday_num})"
@@ -1,8 +1,9 @@
 import re
 import ast
 import operator
+import functools
 import logging
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Callable
 
 from langchain.tools import tool
 
@@ -21,6 +22,9 @@ SAFE_OPERATORS = {
     ast.UAdd: operator.pos,
 }
 
+# Characters allowed in a mathematical expression
+VALID_EXPRESSION_PATTERN = re.compile(r"^[0-9+\-*/().\s,a-zA-Z]+$")
+
 # Safe functions for mathematical expressions
 SAFE_FUNCTIONS = {
     "abs": abs,
@@ -31,12 +35,150 @@ SAFE_FUNCTIONS = {
 }
 
 
+def _compile_expression_node(node: ast.Expression) -> Callable[[], Any]:
+    return _compile_node(node.body)
+
+
+def _compile_constant(node: ast.Constant) -> Callable[[], Any]:
+    value = node.value
+    return lambda: value
+
+
+def _compile_binop(node: ast.BinOp) -> Callable[[], Any]:
+    left = _compile_node(node.left)
+    right = _compile_node(node.right)
+    op_func = SAFE_OPERATORS.get(type(node.op))
+    if op_func is None:
+        raise ValueError(f"Unsupported operation: {type(node.op).__name__}")
+    return lambda: op_func(left(), right())
+
+
+def _compile_unaryop(node: ast.UnaryOp) -> Callable[[], Any]:
+    operand = _compile_node(node.operand)
+    op_func = SAFE_OPERATORS.get(type(node.op))
+    if op_func is None:
+        raise ValueError(f"Unsupported unary operation: {type(node.op).__name__}")
+    return lambda: op_func(operand())
+
+
+def _compile_call(node: ast.Call) -> Callable[[], Any]:
+    func_name = node.func.id if isinstance(node.func, ast.Name) else None
+    if func_name not in SAFE_FUNCTIONS:
+        raise ValueError(f"Unsupported function: {func_name}")
+    func = SAFE_FUNCTIONS[func_name]
+    args = [_compile_node(arg) for arg in node.args]
+    return lambda: func(*[arg() for arg in args])
+
+
+def _compile_list(node: ast.List) -> Callable[[], Any]:
+    items = [_compile_node(item) for item in node.elts]
+    return lambda: [item() for item in items]
+
+
+# Compile handlers for supported AST node types
+NODE_COMPILERS = {
+    ast.Expression: _compile_expression_node,
+    ast.Constant: _compile_constant,
+    ast.BinOp: _compile_binop,
+    ast.UnaryOp: _compile_unaryop,
+    ast.Call: _compile_call,
+    ast.List: _compile_list,
+}
+
+
+def _compile_node(node: ast.AST) -> Callable[[], Any]:
+    """
+    Compile a single AST node into a zero-argument callable.
+
+    Operators and functions are resolved once here and captured in the
+    returned closure, so evaluation does no type dispatch or dict lookups.
+
+    Args:
+        node: AST node to compile
+
+    Returns:
+        Callable that evaluates the node
+
+    Raises:
+        ValueError: If the node contains unsupported operations
+    """
+    handler = NODE_COMPILERS.get(type(node))
+    if handler is None:
+        raise ValueError(f"Unsupported AST node type: {type(node).__name__}")
+    return handler(node)
+
+
+def _is_literal(node: ast.AST) -> bool:
+    """Check whether a node is a literal value or a list of literals."""
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.List):
+        return all(_is_literal(item) for item in node.elts)
+    return False
+
+
+# Folded integers above this size are not stored in compiled expressions, so
+# the compile cache never pins huge values such as 9**999990
+MAX_FOLDED_INT_BITS = 4096
+
+
+class ConstantFolder(ast.NodeTransformer):
+    """Replace subtrees whose operands are all literals with their value."""
+
+    def _fold(self, node: ast.AST, operands) -> ast.AST:
+        if all(_is_literal(operand) for operand in operands):
+            value = _compile_node(node)()
+            if isinstance(value, int) and value.bit_length() > MAX_FOLDED_INT_BITS:
+                return node
+            return ast.copy_location(ast.Constant(value=value), node)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        return self._fold(node, (node.left, node.right))
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        return self._fold(node, (node.operand,))
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        return self._fold(node, node.args)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Callable[[], Any]:
+    """
+    Parse a mathematical expression and compile it into a callable.
+
+    Literal-only subtrees are folded into constants before compiling.
+
+    Args:
+        expression: Mathematical expression as string
+
+    Returns:
+        Callable that evaluates the expression
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+        ValueError: If the expression contains unsupported operations
+        ZeroDivisionError: If a folded subtree divides by zero
+    """
+    tree = ast.parse(expression, mode="eval")
+
+    # Evaluate literal-only subtrees once, at compile time
+    tree = ConstantFolder().visit(tree)
+
+    return _compile_node(tree)
+
+
 def safe_eval(expression: str) -> Union[int, float]:
     """
     Safely evaluate a mathematical expression without using eval().
 
     This function uses AST parsing to evaluate mathematical expressions
-    safely, preventing code injection attacks.
+    safely, preventing code injection attacks. Compiled expressions are
+    cached by compile_expression, so repeated calculations skip parsing.
 
     Args:
         expression: Mathematical expression as string
@@ -49,43 +191,8 @@ def safe_eval(expression: str) -> Union[int, float]:
         ZeroDivisionError: If division by zero occurs
     """
     try:
-        # Parse the expression into an AST
-        tree = ast.parse(expression, mode="eval")
-
-        def _eval_node(node):
-            if isinstance(node, ast.Expression):
-                return _eval_node(node.body)
-            elif isinstance(node, ast.Constant):  # Python 3.8+
-                return node.value
-            elif isinstance(node, ast.Num):  # Python < 3.8
-                return node.n
-            elif isinstance(node, ast.BinOp):
-                left = _eval_node(node.left)
-                right = _eval_node(node.right)
-                op_func = SAFE_OPERATORS.get(type(node.op))
-                if op_func is None:
-                    raise ValueError(f"Unsupported operation: {type(node.op).__name__}")
-                return op_func(left, right)
-            elif isinstance(node, ast.UnaryOp):
-                operand = _eval_node(node.operand)
-                op_func = SAFE_OPERATORS.get(type(node.op))
-                if op_func is None:
-                    raise ValueError(
-                        f"Unsupported unary operation: {type(node.op).__name__}"
-                    )
-                return op_func(operand)
-            elif isinstance(node, ast.Call):
-                func_name = node.func.id if isinstance(node.func, ast.Name) else None
-                if func_name not in SAFE_FUNCTIONS:
-                    raise ValueError(f"Unsupported function: {func_name}")
-                args = [_eval_node(arg) for arg in node.args]
-                return SAFE_FUNCTIONS[func_name](*args)
-            elif isinstance(node, ast.List):
-                return [_eval_node(item) for item in node.elts]
-            else:
-                raise ValueError(f"Unsupported AST node type: {type(node).__name__}")
-
-        result = _eval_node(tree)
+        # Compile once, then run the pre-bound closures
+        result = compile_expression(expression)()
 
         # Ensure result is a number
         if not isinstance(result, (int, float)):
@@ -124,11 +231,19 @@ def validate_math_expression(expression: str) -> str:
         raise ValueError("Expression cannot be empty after cleaning")
 
     # Check for basic validity
-    if not re.match(r"^[0-9+\-*/().\s,a-zA-Z]+$", expression):
+    if not VALID_EXPRESSION_PATTERN.match(expression):
         raise ValueError("Expression contains invalid characters")
 
-    # Check for balanced parentheses
-    if expression.count("(") != expression.count(")"):
+    # Check for balanced parentheses in one pass, rejecting early closers
+    depth = 0
+    for char in expression:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                raise ValueError("Unbalanced parentheses in expression")
+    if depth != 0:
         raise ValueError("Unbalanced parentheses in expression")
 
     return expression
@@ -177,8 +292,16 @@ def calculate(expression: str) -> str:
         clean_expression = validate_math_expression(actual_expression)
         logger.debug(f"Cleaned expression: {clean_expression}")
 
-        # Perform safe calculation
-        result = safe_eval(clean_expression)
+        # Plain numeric literals like "42" or "3.14" need no parsing. Integers
+        # with leading zeros such as "007" still go to the parser, which rejects them.
+        is_number = clean_expression.replace(".", "", 1).isdigit()
+        if is_number and "." in clean_expression:
+            result = float(clean_expression)
+        elif is_number and (clean_expression == "0" or clean_expression[0] != "0"):
+            result = int(clean_expression)
+        else:
+            # Perform safe calculation
+            result = safe_eval(clean_expression)
 
         # Format result based on type
         if isinstance(result, float):
@@ -212,21 +335,8 @@ def calculate(expression: str) -> str:
         return error_msg
 
 
-@tool
-def math_help() -> str:
-    """
-    Get help and information about mathematical operations and functions available.
-
-    This tool provides guidance on:
-    - Supported mathematical operations
-    - Available functions
-    - Syntax and examples
-    - Common use cases
-
-    Returns:
-        String containing comprehensive help information about mathematical capabilities
-    """
-    help_text = """Mathematical Calculator Help
+# Static help text returned by math_help
+MATH_HELP_TEXT = """Mathematical Calculator Help
 
 SUPPORTED OPERATIONS:
 • Basic arithmetic: +, -, *, /, //, %, **
@@ -262,4 +372,19 @@ LIMITATIONS:
 
 Ask me to calculate any mathematical expression following these guidelines!"""
 
-    return help_text
+
+@tool
+def math_help() -> str:
+    """
+    Get help and information about mathematical operations and functions available.
+
+    This tool provides guidance on:
+    - Supported mathematical operations
+    - Available functions
+    - Syntax and examples
+    - Common use cases
+
+    Returns:
+        String containing comprehensive help information about mathematical capabilities
+    """
+    return MATH_HELP_TEXT
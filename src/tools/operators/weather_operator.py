@@ -1,7 +1,14 @@
+import re
+import time
+import functools
+import threading
 import requests
 import logging
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from langchain.tools import tool
 
@@ -11,6 +18,135 @@ logger = logging.getLogger(__name__)
 FORECAST_API_URL = "https://api.open-meteo.com/v1/forecast"
 GEOCODING_API_URL = "https://geocoding-api.open-meteo.com/v1/search"
 
+# "latitude,longitude" input such as "52.52,13.41", "-33.87, 151.21" or "+52., .5"
+_COORDINATE = r"[+-]?(?:\d+\.?\d*|\.\d+)"
+COORDINATES_PATTERN = re.compile(rf"^\s*({_COORDINATE})\s*,\s*({_COORDINATE})\s*$")
+# Comma-separated input with a number on either side, e.g. "52.52, abc", is a
+# malformed coordinate pair rather than a place name such as "Paris, France"
+PARTIAL_COORDINATES_PATTERN = re.compile(rf"^\s*{_COORDINATE}\s*,|,\s*{_COORDINATE}\s*$")
+
+# Shared HTTP session so connections to Open-Meteo are kept alive and pooled
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
+# In-process cache lifetimes (seconds) and maximum number of entries
+GEOCODE_CACHE_TTL = 24 * 60 * 60
+FORECAST_CACHE_TTL = 10 * 60
+GEOCODE_CACHE_SIZE = 512
+FORECAST_CACHE_SIZE = 256
+
+# Cache entries are (stored_at, value) tuples keyed on the request, kept in
+# least-recently-used order so the oldest entry is evicted first
+_geocode_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+_forecast_cache: OrderedDict[Tuple, Tuple[float, Dict[str, Any]]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# WMO weather code descriptions
+WEATHER_CODES = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    56: "Light freezing drizzle",
+    57: "Dense freezing drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    66: "Light freezing rain",
+    67: "Heavy freezing rain",
+    71: "Slight snow fall",
+    73: "Moderate snow fall",
+    75: "Heavy snow fall",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail",
+}
+
+# Current weather fields rendered by format_weather_response: (key, label, unit)
+CURRENT_WEATHER_FIELDS = (
+    ("temperature_2m", "Temperature", "°C"),
+    ("relative_humidity_2m", "Humidity", "%"),
+    ("wind_speed_10m", "Wind Speed", " km/h"),
+    ("wind_direction_10m", "Wind Direction", "°"),
+    ("precipitation", "Precipitation", " mm"),
+)
+
+# Open-Meteo fields requested by each tool, limited to what the output renders
+CURRENT_WEATHER_API_FIELDS = tuple(key for key, _, _ in CURRENT_WEATHER_FIELDS) + (
+    "weather_code",
+)
+DAILY_SUMMARY_API_FIELDS = ("temperature_2m_max", "temperature_2m_min")
+DAILY_SUMMARY_DAYS = 5
+FORECAST_API_FIELDS = (
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "weather_code",
+    "precipitation_sum",
+    "wind_speed_10m_max",
+)
+
+# Index-based lookup table for WMO codes 0-99 (None for unassigned codes)
+WEATHER_DESCRIPTIONS = tuple(WEATHER_CODES.get(code) for code in range(100))
+
+
+def _cache_get(cache: OrderedDict, key: Any, ttl: float) -> Optional[Any]:
+    """
+    Return a cached value if it is still fresh, dropping it once expired.
+
+    Args:
+        cache: Cache to read from
+        key: Cache key
+        ttl: Maximum entry age in seconds
+
+    Returns:
+        The cached value, or None on a miss or an expired entry
+    """
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+    """
+    Store a value in a cache, evicting least recently used entries over max_size.
+
+    Args:
+        cache: Cache to write to
+        key: Cache key
+        value: Value to store
+        max_size: Maximum number of entries to keep
+    """
+    with _cache_lock:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
 
 def geocode_location(location: str) -> Optional[Dict[str, float]]:
     """
@@ -22,23 +158,32 @@ def geocode_location(location: str) -> Optional[Dict[str, float]]:
     Returns:
         Dictionary with 'latitude' and 'longitude' keys, or None if not found
     """
+    cache_key = location.strip().lower()
+    cached = _cache_get(_geocode_cache, cache_key, GEOCODE_CACHE_TTL)
+    if cached is not None:
+        logger.debug(f"Geocoding cache hit for location '{location}'")
+        return dict(cached)
+
     try:
         params = {"name": location, "count": 1, "language": "en", "format": "json"}
 
-        response = requests.get(GEOCODING_API_URL, params=params, timeout=10)
+        response = _session.get(GEOCODING_API_URL, params=params, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        from shared.input_utils import loads_json
+        data = loads_json(response.content)
 
         if data.get("results") and len(data["results"]) > 0:
             result = data["results"][0]
-            return {
+            location_info = {
                 "latitude": result["latitude"],
                 "longitude": result["longitude"],
                 "name": result["name"],
                 "country": result.get("country", ""),
                 "admin1": result.get("admin1", ""),
             }
+            _cache_put(_geocode_cache, cache_key, location_info, GEOCODE_CACHE_SIZE)
+            return dict(location_info)
 
         return None
 
@@ -47,6 +192,37 @@ def geocode_location(location: str) -> Optional[Dict[str, float]]:
         return None
 
 
+def fetch_forecast(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fetch forecast data from Open-Meteo, reusing recent identical requests.
+
+    Args:
+        params: Query parameters for the forecast API
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    cache_key = tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in sorted(params.items())
+    )
+    cached = _cache_get(_forecast_cache, cache_key, FORECAST_CACHE_TTL)
+    if cached is not None:
+        logger.debug("Forecast cache hit")
+        return cached
+
+    response = _session.get(FORECAST_API_URL, params=params, timeout=15)
+    response.raise_for_status()
+
+    from shared.input_utils import loads_json
+    weather_data = loads_json(response.content)
+    _cache_put(_forecast_cache, cache_key, weather_data, FORECAST_CACHE_SIZE)
+    return weather_data
+
+
 def format_weather_response(data: Dict[str, Any], location_info: Dict[str, Any]) -> str:
     """
     Format the weather data response into a readable string.
@@ -72,28 +248,13 @@ def format_weather_response(data: Dict[str, Any], location_info: Dict[str, Any])
             current_time = current.get("time", "")
             response_parts.append(f"\nCurrent weather (as of {current_time}):")
 
-            if "temperature_2m" in current:
-                temp = current["temperature_2m"]
-                response_parts.append(f"• Temperature: {temp}°C")
-
-            if "relative_humidity_2m" in current:
-                humidity = current["relative_humidity_2m"]
-                response_parts.append(f"• Humidity: {humidity}%")
+            for key, label, unit in CURRENT_WEATHER_FIELDS:
+                value = current.get(key)
+                if value is not None:
+                    response_parts.append(f"• {label}: {value}{unit}")
 
-            if "wind_speed_10m" in current:
-                wind_speed = current["wind_speed_10m"]
-                response_parts.append(f"• Wind Speed: {wind_speed} km/h")
-
-            if "wind_direction_10m" in current:
-                wind_dir = current["wind_direction_10m"]
-                response_parts.append(f"• Wind Direction: {wind_dir}°")
-
-            if "precipitation" in current:
-                precip = current["precipitation"]
-                response_parts.append(f"• Precipitation: {precip} mm")
-
-            if "weather_code" in current:
-                weather_code = current["weather_code"]
+            weather_code = current.get("weather_code")
+            if weather_code is not None:
                 weather_desc = get_weather_description(weather_code)
                 response_parts.append(f"• Conditions: {weather_desc}")
 
@@ -106,7 +267,7 @@ def format_weather_response(data: Dict[str, Any], location_info: Dict[str, Any])
             temp_max = daily.get("temperature_2m_max", [])
             temp_min = daily.get("temperature_2m_min", [])
 
-            for i, date in enumerate(dates[:5]):  # Show next 5 days
+            for i, date in enumerate(dates[:DAILY_SUMMARY_DAYS]):
                 if i < len(temp_max) and i < len(temp_min):
                     response_parts.append(
                         f"• {date}: {temp_min[i]}°C to {temp_max[i]}°C"
@@ -126,6 +287,23 @@ def format_weather_response(data: Dict[str, Any], location_info: Dict[str, Any])
         return f"Error formatting weather data: {str(e)}"
 
 
+@functools.lru_cache(maxsize=32)
+def format_forecast_date(date: str) -> str:
+    """
+    Format an ISO forecast date like "2024-01-01" as "Monday, January 01".
+
+    Args:
+        date: ISO date string from the forecast API
+
+    Returns:
+        Formatted date, or the input unchanged if it cannot be parsed
+    """
+    try:
+        return datetime.fromisoformat(date).strftime("%A, %B %d")
+    except (TypeError, ValueError):
+        return date
+
+
 def get_weather_description(weather_code: int) -> str:
     """
     Convert weather code to human-readable description.
@@ -136,40 +314,16 @@ def get_weather_description(weather_code: int) -> str:
     Returns:
         Human-readable weather description
     """
-    weather_codes = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Fog",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        56: "Light freezing drizzle",
-        57: "Dense freezing drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        66: "Light freezing rain",
-        67: "Heavy freezing rain",
-        71: "Slight snow fall",
-        73: "Moderate snow fall",
-        75: "Heavy snow fall",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail",
-    }
-
-    return weather_codes.get(
-        weather_code, f"Unknown weather condition (code: {weather_code})"
-    )
+    if isinstance(weather_code, int) and 0 <= weather_code < len(WEATHER_DESCRIPTIONS):
+        description = WEATHER_DESCRIPTIONS[weather_code]
+    else:
+        # Other inputs, such as integral floats like 3.0, use the dict lookup
+        description = WEATHER_CODES.get(weather_code)
+
+    if description is not None:
+        return description
+
+    return f"Unknown weather condition (code: {weather_code})"
 
 
 @tool
@@ -209,18 +363,17 @@ def get_current_weather(location: str, include_forecast: bool = False) -> str:
         actual_location = parse_location_input(location)
 
         # Check if input is coordinates (lat,lon format)
-        if "," in actual_location:
-            try:
-                lat_str, lon_str = actual_location.split(",", 1)
-                latitude = float(lat_str.strip())
-                longitude = float(lon_str.strip())
-                location_info = {
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "name": f"Coordinates ({latitude}, {longitude})",
-                }
-            except ValueError:
-                return "Error: Invalid coordinate format. Use 'latitude,longitude' (e.g., '52.52,13.41')"
+        coordinates = COORDINATES_PATTERN.match(actual_location)
+        if coordinates:
+            latitude = float(coordinates.group(1))
+            longitude = float(coordinates.group(2))
+            location_info = {
+                "latitude": latitude,
+                "longitude": longitude,
+                "name": f"Coordinates ({latitude}, {longitude})",
+            }
+        elif PARTIAL_COORDINATES_PATTERN.search(actual_location):
+            return "Error: Invalid coordinate format. Use 'latitude,longitude' (e.g., '52.52,13.41')"
         else:
             # Geocode location name
             location_info = geocode_location(actual_location)
@@ -231,32 +384,17 @@ def get_current_weather(location: str, include_forecast: bool = False) -> str:
         params = {
             "latitude": location_info["latitude"],
             "longitude": location_info["longitude"],
-            "current": [
-                "temperature_2m",
-                "relative_humidity_2m",
-                "precipitation",
-                "weather_code",
-                "wind_speed_10m",
-                "wind_direction_10m",
-            ],
+            "current": list(CURRENT_WEATHER_API_FIELDS),
             "timezone": "auto",
         }
 
         # Add daily forecast if requested
         if include_forecast:
-            params["daily"] = [
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "weather_code",
-                "precipitation_sum",
-            ]
-            params["forecast_days"] = 7
+            params["daily"] = list(DAILY_SUMMARY_API_FIELDS)
+            params["forecast_days"] = DAILY_SUMMARY_DAYS
 
         # Make API request
-        response = requests.get(FORECAST_API_URL, params=params, timeout=15)
-        response.raise_for_status()
-
-        weather_data = response.json()
+        weather_data = fetch_forecast(params)
 
         # Format and return response
         formatted_response = format_weather_response(weather_data, location_info)
@@ -317,18 +455,17 @@ def get_weather_forecast(location: str, days: int = 7) -> str:
         actual_location = parse_location_input(location)
 
         # Check if input is coordinates (lat,lon format)
-        if "," in actual_location:
-            try:
-                lat_str, lon_str = actual_location.split(",", 1)
-                latitude = float(lat_str.strip())
-                longitude = float(lon_str.strip())
-                location_info = {
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "name": f"Coordinates ({latitude}, {longitude})",
-                }
-            except ValueError:
-                return "Error: Invalid coordinate format. Use 'latitude,longitude' (e.g., '52.52,13.41')\n"
+        coordinates = COORDINATES_PATTERN.match(actual_location)
+        if coordinates:
+            latitude = float(coordinates.group(1))
+            longitude = float(coordinates.group(2))
+            location_info = {
+                "latitude": latitude,
+                "longitude": longitude,
+                "name": f"Coordinates ({latitude}, {longitude})",
+            }
+        elif PARTIAL_COORDINATES_PATTERN.search(actual_location):
+            return "Error: Invalid coordinate format. Use 'latitude,longitude' (e.g., '52.52,13.41')\n"
         else:
             # Geocode location name
             location_info = geocode_location(actual_location)
@@ -339,23 +476,13 @@ def get_weather_forecast(location: str, days: int = 7) -> str:
         params = {
             "latitude": location_info["latitude"],
             "longitude": location_info["longitude"],
-            "daily": [
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "weather_code",
-                "precipitation_sum",
-                "wind_speed_10m_max",
-                "wind_direction_10m_dominant",
-            ],
+            "daily": list(FORECAST_API_FIELDS),
             "timezone": "auto",
             "forecast_days": days,
         }
 
         # Make API request
-        response = requests.get(FORECAST_API_URL, params=params, timeout=15)
-        response.raise_for_status()
-
-        weather_data = response.json()
+        weather_data = fetch_forecast(params)
 
         # Format detailed forecast response
         location_name = location_info.get("name", "Unknown Location")
@@ -374,31 +501,27 @@ def get_weather_forecast(location: str, days: int = 7) -> str:
             precipitation = daily.get("precipitation_sum", [])
             wind_speed = daily.get("wind_speed_10m_max", [])
 
-            for i, date in enumerate(dates):
-                if i < len(temp_max) and i < len(temp_min):
-                    # Parse date for better formatting
-                    try:
-                        date_obj = datetime.fromisoformat(date)
-                        formatted_date = date_obj.strftime("%A, %B %d")
-                    except:
-                        formatted_date = date
-
-                    day_info = [f"\n{formatted_date}:"]
-                    day_info.append(
-                        f"  • Temperature: {temp_min[i]}°C to {temp_max[i]}°C"
-                    )
+            # Only days with both temperature bounds are shown
+            day_count = min(len(dates), len(temp_max), len(temp_min))
+            formatted_dates = [format_forecast_date(date) for date in dates[:day_count]]
+            conditions = [
+                get_weather_description(code) for code in weather_codes[:day_count]
+            ]
 
-                    if i < len(weather_codes):
-                        conditions = get_weather_description(weather_codes[i])
-                        day_info.append(f"  • Conditions: {conditions}")
+            for i in range(day_count):
+                day_info = [f"\n{formatted_dates[i]}:"]
+                day_info.append(f"  • Temperature: {temp_min[i]}°C to {temp_max[i]}°C")
 
-                    if i < len(precipitation):
-                        day_info.append(f"  • Precipitation: {precipitation[i]} mm")
+                if i < len(conditions):
+                    day_info.append(f"  • Conditions: {conditions[i]}")
 
-                    if i < len(wind_speed):
-                        day_info.append(f"  • Max Wind Speed: {wind_speed[i]} km/h")
+                if i < len(precipitation):
+                    day_info.append(f"  • Precipitation: {precipitation[i]} mm")
 
-                    response_parts.extend(day_info)
+                if i < len(wind_speed):
+                    day_info.append(f"  • Max Wind Speed: {wind_speed[i]} km/h")
+
+                response_parts.extend(day_info)
 
         formatted_response = "\n".join(response_parts)
         logger.info(
@@ -417,21 +540,8 @@ def get_weather_forecast(location: str, days: int = 7) -> str:
         return error_msg + "\n"
 
 
-@tool
-def weather_help() -> str:
-    """
-    Get help and information about weather tools and capabilities.
-
-    This tool provides guidance on:
-    - Available weather functions
-    - Supported location formats
-    - Weather data types
-    - Usage examples
-
-    Returns:
-        String containing comprehensive help information about weather capabilities
-    """
-    help_text = """Weather Tools Help
+# Static help text returned by weather_help (already newline-terminated)
+WEATHER_HELP_TEXT = """Weather Tools Help
 
 AVAILABLE WEATHER FUNCTIONS:
 • get_current_weather(location, include_forecast=False) - Current weather conditions
@@ -478,6 +588,21 @@ ERROR HANDLING:
 • Invalid input validation
 • Detailed error messages
 
-Ask me for weather information for any location worldwide!"""
+Ask me for weather information for any location worldwide!\n"""
+
+
+@tool
+def weather_help() -> str:
+    """
+    Get help and information about weather tools and capabilities.
+
+    This tool provides guidance on:
+    - Available weather functions
+    - Supported location formats
+    - Weather data types
+    - Usage examples
 
-    return help_text + "\n"
+    Returns:
+        String containing comprehensive help information about weather capabilities
+    """
+    return WEATHER_HELP_TEXT
@@ -0,0 +1,120 @@
+"""
+Unit tests for the datetime operator tools.
+
+Focus: timestamps and dates that are resolved locally without calling the
+digidatesAPI.
+"""
+
+import time
+import pytest
+
+from tools.operators import datetime_operator
+from tools.operators.datetime_operator import (
+    get_unix_time,
+    get_week_number,
+    get_weekday,
+    parse_timestamp_locally,
+    validate_date,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_api(monkeypatch):
+    """Fail loudly if a locally handled input reaches the digidatesAPI."""
+    def fail(endpoint, params=None):
+        raise AssertionError(f"Unexpected API call to {endpoint}")
+
+    monkeypatch.setattr(datetime_operator, "make_digidates_request", fail)
+
+
+@pytest.fixture
+def berlin_host(monkeypatch):
+    """Run the test with the process timezone set to Europe/Berlin."""
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestGetUnixTime:
+    """Test suite for local timestamp conversion in get_unix_time."""
+
+    def test_current_time_without_timestamp(self):
+        """Test that the current time comes from the local clock."""
+        before = int(time.time())
+        result = get_unix_time.invoke({})
+        after = int(time.time())
+
+        unix_time = int(result.split(": ")[1].split(" ")[0])
+        assert before <= unix_time <= after
+        assert "Current date:" in result
+
+    def test_naive_iso_timestamp_is_utc(self, berlin_host):
+        """Test that a naive ISO timestamp is converted as UTC on any host."""
+        result = get_unix_time.invoke({"timestamp": "1970-01-01 00:00:01"})
+
+        assert result == "Unix timestamp for '1970-01-01 00:00:01': 1 (Date: 1970-01-01)"
+
+    def test_zulu_timestamp(self, berlin_host):
+        """Test that a trailing Z timestamp gives the same UTC result."""
+        result = get_unix_time.invoke({"timestamp": "2022-01-01T23:30:00Z"})
+
+        assert result == "Unix timestamp for '2022-01-01T23:30:00Z': 1641079800 (Date: 2022-01-01)"
+
+    def test_rfc2822_timestamp_without_zone_is_utc(self, berlin_host):
+        """Test that an RFC 2822 timestamp without a zone is converted as UTC."""
+        result = get_unix_time.invoke({"timestamp": "Sat, 01 Jan 2022 00:00:00"})
+
+        assert result == "Unix timestamp for 'Sat, 01 Jan 2022 00:00:00': 1640995200 (Date: 2022-01-01)"
+
+    def test_rfc2822_timestamp_with_offset(self):
+        """Test that an explicit offset is honoured and the date is reported in UTC."""
+        result = get_unix_time.invoke({"timestamp": "Sat, 01 Jan 2022 23:00:00 -0500"})
+
+        assert result == "Unix timestamp for 'Sat, 01 Jan 2022 23:00:00 -0500': 1641096000 (Date: 2022-01-02)"
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            "Fri, 31 Dec 9999 23:59:59 -1200",  # outside datetime's range in UTC
+            "Sat, 01 Jan 0050 00:00:00 +0000",  # 4-digit year below 100
+        ],
+    )
+    def test_unsupported_timestamps_fall_back_to_api(self, timestamp, monkeypatch):
+        """Test that timestamps the local parser cannot handle go to the API."""
+        calls = []
+
+        def fake_request(endpoint, params=None):
+            calls.append((endpoint, params))
+            return {"time": 42}
+
+        monkeypatch.setattr(datetime_operator, "make_digidates_request", fake_request)
+
+        assert parse_timestamp_locally(timestamp) is None
+        result = get_unix_time.invoke({"timestamp": timestamp})
+
+        assert calls == [("/unixtime", {"timestamp": timestamp})]
+        assert result == f"Unix timestamp for '{timestamp}': 42 (Date: 1970-01-01)"
+
+    def test_rfc2822_two_digit_year(self):
+        """Test that two-digit RFC 2822 years keep the standard 20xx mapping."""
+        assert parse_timestamp_locally("Sat, 01 Jan 22 00:00:00 +0000").year == 2022
+
+
+class TestLocalDateTools:
+    """Test suite for ISO dates answered without the API."""
+
+    def test_week_number(self):
+        """Test ISO week number for a date that belongs to the previous year's week."""
+        assert get_week_number.invoke({"date": "2022-01-01"}) == "Week number for 2022-01-01: 52"
+
+    def test_weekday_uses_sunday_as_zero(self):
+        """Test that weekday numbering matches the API (0=Sunday)."""
+        result = get_weekday.invoke({"date": "2023-01-01"})
+
+        assert result == "Date 2023-01-01 falls on a Sunday (weekday number: 0)"
+
+    def test_validate_date(self):
+        """Test that a valid ISO date is confirmed locally."""
+        assert validate_date.invoke({"date": "2020-02-29"}) == "Date 2020-02-29 is valid"
@@ -0,0 +1,100 @@
+"""
+Unit tests for the math operator tools.
+
+Focus: the plain-number fast path and the safe expression evaluator in calculate.
+"""
+
+import ast
+import pytest
+
+from tools.operators.math_operator import ConstantFolder, calculate, compile_expression
+
+
+class TestCalculateNumericLiterals:
+    """Test suite for numeric literals answered without parsing."""
+
+    @pytest.mark.parametrize(
+        "expression,expected",
+        [("42", "42"), ("3.14", "3.14"), (".5", "0.5")],
+    )
+    def test_numeric_literal(self, expression, expected):
+        """Test that plain numbers are returned as their value."""
+        result = calculate.invoke({"expression": expression})
+
+        assert result == f"The calculation result is {expected}, as {expression} = {expected}."
+
+    def test_leading_zero_integer_is_rejected(self):
+        """Test that "007" is rejected like any other invalid Python literal."""
+        result = calculate.invoke({"expression": "007"})
+
+        assert result.startswith("Error:")
+        assert "leading zeros" in result
+
+
+class TestCalculateSafeEvaluation:
+    """Test suite for expressions evaluated by the compiled AST evaluator."""
+
+    @pytest.mark.parametrize(
+        "expression,expected",
+        [
+            ("2*(3+4)-abs(-5)", "9"),
+            ("round(2.567,2)", "2.57"),
+            ("max(1,2)", "2"),
+            ("min(3, max(1,2)) ** 2", "4"),
+        ],
+    )
+    def test_supported_expression(self, expression, expected):
+        """Test nested arithmetic and allowed function calls."""
+        result = calculate.invoke({"expression": expression})
+
+        assert result == f"The calculation result is {expected}, as {expression} = {expected}."
+
+    @pytest.mark.parametrize(
+        "expression,message",
+        [
+            ("x+1", "Unsupported AST node type: Name"),
+            ("foo(1)", "Unsupported function: foo"),
+            ("sqrt(4)", "Unsupported function: sqrt"),
+            ("1,2", "Unsupported AST node type: Tuple"),
+        ],
+    )
+    def test_unsupported_expression_is_rejected(self, expression, message):
+        """Test that names, unknown functions and tuples are refused."""
+        result = calculate.invoke({"expression": expression})
+
+        assert result == f"Error: Invalid mathematical expression: {message}"
+
+    @pytest.mark.parametrize("expression", ["2;3", "2$3", '__import__("os")'])
+    def test_invalid_characters_are_rejected(self, expression):
+        """Test that characters outside the allowed set never reach the parser."""
+        assert calculate.invoke({"expression": expression}) == "Error: Expression contains invalid characters"
+
+    @pytest.mark.parametrize("expression", ["1/0", "5/(2-2)"])
+    def test_division_by_zero(self, expression):
+        """Test that division by zero returns the dedicated error message."""
+        result = calculate.invoke({"expression": expression})
+
+        assert result == "Error: Division by zero is not allowed in mathematical expressions."
+
+
+class TestConstantFolding:
+    """Test suite for compile-time folding of literal subtrees."""
+
+    def test_literal_expression_is_folded(self):
+        """Test that a literal-only expression becomes a single constant."""
+        tree = ConstantFolder().visit(ast.parse("2*(3+4)", mode="eval"))
+
+        assert isinstance(tree.body, ast.Constant)
+        assert tree.body.value == 14
+        assert compile_expression("2*(3+4)")() == 14
+
+    def test_division_by_zero_raises_at_compile_time(self):
+        """Test that folding surfaces division by zero while compiling."""
+        with pytest.raises(ZeroDivisionError):
+            compile_expression("1/(1-1)")
+
+    def test_huge_integers_are_not_folded(self):
+        """Test that very large integer results are not stored as constants."""
+        tree = ConstantFolder().visit(ast.parse("2**10000+1", mode="eval"))
+
+        assert isinstance(tree.body, ast.BinOp)
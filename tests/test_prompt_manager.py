@@ -0,0 +1,184 @@
+"""
+Unit tests for prompt_manager.py module.
+
+Focus: prompt loading, cache invalidation and prompt listing.
+"""
+
+import logging
+import os
+import pytest
+
+import prompt_manager
+from prompt_manager import PromptManager
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty shared prompt cache."""
+    PromptManager.clear_cache()
+    yield
+    PromptManager.clear_cache()
+
+
+def set_mtime(path, mtime_ns):
+    """Give a file a fixed modification time."""
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestGetPrompt:
+    """Test suite for PromptManager.get_prompt."""
+
+    def test_get_prompt_strips_content(self, tmp_path):
+        """Test loading a prompt with and without the .md extension."""
+        (tmp_path / "system.md").write_bytes(b"\n  You are helpful.  \n")
+        manager = PromptManager(str(tmp_path))
+
+        assert manager.get_prompt("system") == "You are helpful."
+        assert manager.get_prompt("system.md") == "You are helpful."
+
+    def test_crlf_line_endings_are_normalized(self, tmp_path):
+        """Test that CRLF and CR line endings read like text mode would."""
+        (tmp_path / "windows.md").write_bytes(b"line one\r\nline two\rline three\r\n")
+
+        result = PromptManager(str(tmp_path)).get_prompt("windows")
+
+        assert result == "line one\nline two\nline three"
+
+    def test_missing_prompt_raises_file_not_found(self, tmp_path):
+        """Test that a missing prompt raises FileNotFoundError with the path."""
+        with pytest.raises(FileNotFoundError) as exc_info:
+            PromptManager(str(tmp_path)).get_prompt("missing")
+
+        assert "Prompt file not found" in str(exc_info.value)
+        assert "missing.md" in str(exc_info.value)
+
+    def test_edit_with_new_mtime_is_reloaded(self, tmp_path):
+        """Test that a cached prompt is reloaded once the file's mtime changes."""
+        prompt_file = tmp_path / "edit.md"
+        prompt_file.write_bytes(b"old")
+        set_mtime(prompt_file, 1_000_000_000_000_000_000)
+        manager = PromptManager(str(tmp_path))
+        assert manager.get_prompt("edit") == "old"
+
+        prompt_file.write_bytes(b"new")
+        set_mtime(prompt_file, 1_000_000_001_000_000_000)
+
+        assert manager.get_prompt("edit") == "new"
+
+    def test_edit_with_same_mtime_but_new_size_is_reloaded(self, tmp_path):
+        """Test that a size change invalidates the cache even if mtime is unchanged."""
+        prompt_file = tmp_path / "coarse.md"
+        prompt_file.write_bytes(b"short")
+        set_mtime(prompt_file, 1_000_000_000_000_000_000)
+        manager = PromptManager(str(tmp_path))
+        assert manager.get_prompt("coarse") == "short"
+
+        prompt_file.write_bytes(b"a longer prompt")
+        set_mtime(prompt_file, 1_000_000_000_000_000_000)
+
+        assert manager.get_prompt("coarse") == "a longer prompt"
+
+    def test_unchanged_prompt_is_served_from_cache(self, tmp_path, monkeypatch):
+        """Test that an unchanged prompt is not read again."""
+        (tmp_path / "cached.md").write_bytes(b"cached prompt")
+        manager = PromptManager(str(tmp_path))
+        manager.get_prompt("cached")
+
+        def fail_read(fd, size):
+            raise AssertionError("prompt was read again")
+
+        monkeypatch.setattr(prompt_manager.os, "read", fail_read)
+
+        assert manager.get_prompt("cached") == "cached prompt"
+
+    def test_short_reads_return_full_content(self, tmp_path, monkeypatch):
+        """Test that the whole file is read even when os.read returns partial data."""
+        content = "Grüße aus Köln\n" * 50
+        (tmp_path / "unicode.md").write_bytes(content.encode("utf-8"))
+        real_read = os.read
+
+        def short_read(fd, size):
+            return real_read(fd, min(size, 3))
+
+        monkeypatch.setattr(prompt_manager.os, "read", short_read)
+
+        result = PromptManager(str(tmp_path)).get_prompt("unicode")
+
+        assert result == content.strip()
+
+
+class TestPreloadPrompts:
+    """Test suite for preloading prompts at construction."""
+
+    def test_prompts_are_cached_at_construction(self, tmp_path, monkeypatch):
+        """Test that a preloading manager serves prompts without reading them again."""
+        (tmp_path / "a.md").write_bytes(b"prompt a")
+        (tmp_path / "b.md").write_bytes(b"prompt b")
+        manager = PromptManager(str(tmp_path), preload=True)
+
+        def fail_read(fd, size):
+            raise AssertionError("prompt was read again")
+
+        monkeypatch.setattr(prompt_manager.os, "read", fail_read)
+
+        assert manager.get_prompt("a") == "prompt a"
+        assert manager.get_prompt("b") == "prompt b"
+
+    def test_unreadable_prompt_is_logged_and_skipped(self, tmp_path, caplog):
+        """Test that one unreadable prompt does not stop the others from loading."""
+        (tmp_path / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+        (tmp_path / "good.md").write_bytes(b"good prompt")
+
+        with caplog.at_level(logging.WARNING, logger="prompt_manager"):
+            PromptManager(str(tmp_path), preload=True)
+
+        assert "Could not preload prompt 'broken'" in caplog.text
+        cached_names = [os.path.basename(key) for key in prompt_manager._prompt_cache]
+        assert cached_names == ["good.md"]
+
+
+class TestListAvailablePrompts:
+    """Test suite for PromptManager.list_available_prompts."""
+
+    def test_lists_markdown_files_only(self, tmp_path):
+        """Test that only .md files are listed, sorted and without extension."""
+        for filename in ("b.md", "a.md", "notes.txt"):
+            (tmp_path / filename).write_bytes(b"x")
+        (tmp_path / "folder.md").mkdir()
+
+        assert PromptManager(str(tmp_path)).list_available_prompts() == ["a", "b"]
+
+    def test_new_file_is_listed(self, tmp_path):
+        """Test that a file added after a first listing shows up in the next one."""
+        (tmp_path / "a.md").write_bytes(b"x")
+        manager = PromptManager(str(tmp_path))
+        assert manager.list_available_prompts() == ["a"]
+
+        (tmp_path / "b.md").write_bytes(b"x")
+
+        assert manager.list_available_prompts() == ["a", "b"]
+
+    def test_missing_directory_returns_empty_list(self, tmp_path):
+        """Test that a missing prompts directory lists no prompts."""
+        assert PromptManager(str(tmp_path / "missing")).list_available_prompts() == []
+
+
+class TestGlobalPromptManager:
+    """Test suite for the shared prompt manager instance."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_global_manager(self):
+        """Run each test without a global manager left over from other tests."""
+        prompt_manager.reset_prompt_manager()
+        yield
+        prompt_manager.reset_prompt_manager()
+
+    def test_same_instance_until_reset(self, tmp_path):
+        """Test that the global manager is reused and replaced only after a reset."""
+        first = prompt_manager.get_prompt_manager(str(tmp_path))
+
+        assert prompt_manager.get_prompt_manager(str(tmp_path)) is first
+
+        prompt_manager.reset_prompt_manager()
+
+        assert prompt_manager.get_prompt_manager(str(tmp_path)) is not first
@@ -0,0 +1,151 @@
+"""
+Unit tests for the weather operator helpers.
+
+Focus: in-process caching of Open-Meteo requests, coordinate parsing and
+weather code lookup.
+"""
+
+import json
+from collections import OrderedDict
+
+import pytest
+
+from tools.operators import weather_operator
+from tools.operators.weather_operator import (
+    fetch_forecast,
+    geocode_location,
+    get_current_weather,
+    get_weather_description,
+    get_weather_forecast,
+)
+
+_GEOCODE_BERLIN_BYTES = json.dumps(
+    {
+        "results": [
+            {
+                "latitude": 52.52,
+                "longitude": 13.41,
+                "name": "Berlin",
+                "country": "Germany",
+                "admin1": "Berlin",
+            }
+        ]
+    }
+).encode("utf-8")
+_FORECAST_BYTES = json.dumps({"current": {"temperature_2m": 15.5}}).encode("utf-8")
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def http_calls(monkeypatch):
+    """Record Open-Meteo requests and start every test with empty caches."""
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(url)
+        if url == weather_operator.GEOCODING_API_URL:
+            return FakeResponse(_GEOCODE_BERLIN_BYTES)
+        return FakeResponse(_FORECAST_BYTES)
+
+    monkeypatch.setattr(weather_operator._session, "get", fake_get)
+    monkeypatch.setattr(weather_operator, "_geocode_cache", OrderedDict())
+    monkeypatch.setattr(weather_operator, "_forecast_cache", OrderedDict())
+    return calls
+
+
+class TestWeatherCaching:
+    """Test suite for the geocoding and forecast caches."""
+
+    def test_repeated_geocode_uses_cache(self, http_calls):
+        """Test that a second identical lookup makes no HTTP call."""
+        first = geocode_location("Berlin")
+        second = geocode_location("  berlin ")
+
+        assert first == second
+        assert first["name"] == "Berlin"
+        assert len(http_calls) == 1
+
+    def test_expired_geocode_is_fetched_again(self, http_calls, monkeypatch):
+        """Test that an expired entry is dropped and requested again."""
+        monkeypatch.setattr(weather_operator, "GEOCODE_CACHE_TTL", 0)
+
+        geocode_location("Berlin")
+        geocode_location("Berlin")
+
+        assert len(http_calls) == 2
+
+    def test_repeated_forecast_uses_cache(self, http_calls):
+        """Test that identical forecast parameters are only requested once."""
+        params = {"latitude": 52.52, "longitude": 13.41, "current": ["temperature_2m"]}
+
+        assert fetch_forecast(params) == fetch_forecast(dict(params))
+        assert len(http_calls) == 1
+
+    def test_cache_size_is_bounded(self, http_calls, monkeypatch):
+        """Test that the least recently used entry is evicted over the size limit."""
+        monkeypatch.setattr(weather_operator, "FORECAST_CACHE_SIZE", 2)
+
+        for latitude in (1.0, 2.0, 3.0):
+            fetch_forecast({"latitude": latitude, "longitude": 0.0})
+
+        assert len(weather_operator._forecast_cache) == 2
+        fetch_forecast({"latitude": 1.0, "longitude": 0.0})
+        assert len(http_calls) == 4
+
+
+class TestLocationInput:
+    """Test suite for coordinate and place name input to the weather tools."""
+
+    @pytest.mark.parametrize(
+        "location,name",
+        [
+            ("52.52,13.41", "Coordinates (52.52, 13.41)"),
+            ("-33.87, 151.21", "Coordinates (-33.87, 151.21)"),
+            ("+52., .5", "Coordinates (52.0, 0.5)"),
+        ],
+    )
+    def test_coordinates_skip_geocoding(self, http_calls, location, name):
+        """Test that latitude,longitude input is used directly without geocoding."""
+        result = get_current_weather.invoke({"location": location})
+
+        assert result.startswith(f"Weather information for {name}:")
+        assert http_calls == [weather_operator.FORECAST_API_URL]
+
+    def test_place_name_with_comma_is_geocoded(self, http_calls):
+        """Test that "Paris, France" is looked up instead of parsed as coordinates."""
+        result = get_current_weather.invoke({"location": "Paris, France"})
+
+        assert "Invalid coordinate format" not in result
+        assert http_calls == [weather_operator.GEOCODING_API_URL, weather_operator.FORECAST_API_URL]
+
+    @pytest.mark.parametrize("tool", [get_current_weather, get_weather_forecast])
+    @pytest.mark.parametrize("location", ["52.52, abc", "abc, 13.41", "52.52.1, 13.41"])
+    def test_malformed_coordinates_are_rejected(self, http_calls, tool, location):
+        """Test that a comma-separated pair with a bad number is reported, not geocoded."""
+        result = tool.invoke({"location": location})
+
+        assert result.startswith("Error: Invalid coordinate format.")
+        assert http_calls == []
+
+
+class TestGetWeatherDescription:
+    """Test suite for WMO weather code descriptions."""
+
+    @pytest.mark.parametrize("code", [3, 3.0])
+    def test_known_code(self, code):
+        """Test that integer and integral float codes map to the same description."""
+        assert get_weather_description(code) == "Overcast"
+
+    @pytest.mark.parametrize("code", [4, 3.5, -1, 100, None])
+    def test_unknown_code(self, code):
+        """Test that unassigned or non-integral codes are reported as unknown."""
+        assert get_weather_description(code) == f"Unknown weather condition (code: {code})"